@@ -0,0 +1,71 @@
+""" Benchmark for load throughput (rows/sec) of the file writers against the
+    SQLite sink, run with: `python -m benchmarks.load_throughput [rows]`
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from etl_components.load import (
+    write_solar_data, write_wind_data, write_solar_data_to_sqlite,
+    write_wind_data_to_sqlite
+)
+
+
+def build_generation_df(rows: int, date_range: list) -> pd.DataFrame:
+    """
+    Builds a synthetic transformed generation dataframe spread over the given week
+    :param rows: number of rows to generate
+    :param date_range: Range of dates (latest first) the timestamps should fall in
+    """
+    start = datetime.strptime(date_range[-1], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    variables = 100
+    timestamps = pd.date_range(start, start + timedelta(days=7), periods=rows // variables + 1,
+                               inclusive="left")
+    utc = np.repeat(timestamps, variables)[:rows]
+    return pd.DataFrame({
+        "naive_timestamp": utc.tz_localize(None).astype(str),
+        "variable": np.tile(np.arange(variables), len(timestamps))[:rows],
+        "value": np.random.default_rng(0).random(rows),
+        "last_modified_utc": utc.astype(str),
+        "utc_timestamp": utc.astype(str),
+    })
+
+
+def run_benchmark(rows: int = 200000) -> dict:
+    """
+    Times every load writer on the same synthetic dataframe
+    :param rows: number of rows to load
+    :return: mapping of writer name to throughput in rows/sec
+    """
+    date_range = [(datetime(2024, 1, 7) - timedelta(days=i)).strftime("%Y-%m-%d")
+                  for i in range(0, 7)]
+    df = build_generation_df(rows, date_range)
+    writers = {
+        "write_solar_data (JSON)": lambda: write_solar_data(df, date_range),
+        "write_wind_data (CSV)": lambda: write_wind_data(df, date_range),
+        "write_solar_data_to_sqlite": lambda: write_solar_data_to_sqlite(df, "generation.db"),
+        "write_wind_data_to_sqlite": lambda: write_wind_data_to_sqlite(df, "generation.db"),
+    }
+    results = {}
+    current_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)  # Writers use relative output paths
+        try:
+            for name, writer in writers.items():
+                start = perf_counter()
+                writer()
+                results[name] = rows / (perf_counter() - start)
+        finally:
+            os.chdir(current_dir)
+    return results
+
+
+if __name__ == "__main__":
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    for writer_name, throughput in run_benchmark(row_count).items():
+        print(f"{writer_name:<30} {throughput:>14,.0f} rows/sec")
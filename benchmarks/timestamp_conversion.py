@@ -0,0 +1,54 @@
+""" Benchmark for timestamp conversion throughput (rows/sec) of the previous per-row
+    `apply` transforms against the vectorized column conversion,
+    run with: `python -m benchmarks.timestamp_conversion [rows]`
+"""
+import sys
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from commons.util import (
+    convert_naive_timestamp_to_utc_datetime, convert_utc_datetime_to_naive_datetime,
+    convert_timestamps_to_utc, remove_timestamps_timezone
+)
+
+
+def build_timestamps(rows: int) -> tuple:
+    """
+    Builds synthetic solar (Unix milliseconds) and wind (UTC datetime string) columns
+    :param rows: number of rows to generate
+    """
+    solar = pd.Series(1704067200000 + np.arange(rows, dtype="int64") * 60000)
+    wind = pd.to_datetime(solar, unit="ms", utc=True).dt.strftime("%Y-%m-%d %H:%M:%S+00:00")
+    return solar, wind
+
+
+def run_benchmark(rows: int = 500000) -> dict:
+    """
+    Times the previous and the vectorized conversions on the same synthetic columns
+    :param rows: number of rows to convert
+    :return: mapping of conversion name to throughput in rows/sec
+    """
+    solar, wind = build_timestamps(rows)
+    conversions = {
+        "solar apply (previous)": lambda: solar.apply(convert_naive_timestamp_to_utc_datetime),
+        "solar vectorized": lambda: convert_timestamps_to_utc(solar, "unix"),
+        "wind apply (previous)": lambda: wind.apply(convert_utc_datetime_to_naive_datetime),
+        "wind vectorized": lambda: (convert_timestamps_to_utc(wind, "UTC"),
+                                    remove_timestamps_timezone(wind)),
+        "local zone vectorized": lambda: convert_timestamps_to_utc(
+            wind.str.slice(0, 19), "Europe/Berlin"),
+    }
+    results = {}
+    for name, conversion in conversions.items():
+        start = perf_counter()
+        conversion()
+        results[name] = rows / (perf_counter() - start)
+    return results
+
+
+if __name__ == "__main__":
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    for conversion_name, throughput in run_benchmark(row_count).items():
+        print(f"{conversion_name:<30} {throughput:>14,.0f} rows/sec")
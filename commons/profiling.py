@@ -0,0 +1,196 @@
+""" Opt-in profiling module for the project, wraps pipeline stages with cProfile
+    and tracemalloc when a profile directory is provided, otherwise it is a no-op
+"""
+import cProfile
+import io
+import pstats
+import sys
+import tempfile
+import threading
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime
+from functools import wraps
+from os import environ
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Union
+from commons.logging import logger
+
+
+TOP_FUNCTIONS_COUNT = 30
+TOP_LINES_COUNT = 10
+_disabled_stage = nullcontext()
+# Keeps profiler's own allocations out of the top allocating lines
+_snapshot_filters = (
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+)
+# Before python 3.12 cProfile only hooks the thread which enables it, so callables
+# submitted to worker threads during a stage are profiled separately and merged into
+# the stage stats. From 3.12 a profile sees every thread and only one can be active.
+# Kept per context so concurrently profiled stages don't mix their worker stats
+_PROFILE_PER_THREAD = sys.version_info < (3, 12)
+_worker_profiles = ContextVar("worker_profiles", default=None)
+_worker_profiles_lock = threading.Lock()
+
+
+def profile_in_worker(func: Callable) -> Callable:
+    """
+    Wraps a callable which is going to run in a worker thread, so it is profiled into
+    the currently running stage; returns the callable as it is if no stage is profiled
+    :param func: callable submitted to a worker thread e.g. `executor.submit`
+    """
+    worker_profiles = _worker_profiles.get()
+    if worker_profiles is None or not _PROFILE_PER_THREAD:
+        return func
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiling tool is active, profiling must never fail the callable
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+            with _worker_profiles_lock:
+                worker_profiles.append(profile)
+    return wrapper
+
+
+class RunProfiler:
+    """
+    Collects CPU (cProfile) and memory (tracemalloc) statistics per pipeline stage
+    for one run and writes them to a new `<profile_dir>/<run timestamp>_<suffix>/`. If no
+    profile directory is provided the profiler is disabled and `stage` costs a single call.
+    Memory is traced in full (not sampled) while a stage runs; the two snapshots per stage
+    for top allocating lines are the costliest part on large frames and can be turned
+    off with env var ETL_PROFILE_SNAPSHOTS=0, keeping only memory deltas and peaks.
+    """
+
+    def __init__(self, profile_dir: Union[str, None] = None):
+        """
+        :param profile_dir: directory to write profile reports to, defaults to env
+            var ETL_PROFILE_DIR; profiling is disabled if neither is set
+        """
+        profile_dir = profile_dir or environ.get("ETL_PROFILE_DIR")
+        self.enabled = bool(profile_dir)
+        self.output_dir = None
+        self.stages = []
+        self.combined_stats = None
+        self.take_snapshots = environ.get("ETL_PROFILE_SNAPSHOTS", "1") != "0"
+        if self.enabled:
+            try:
+                Path(profile_dir).mkdir(parents=True, exist_ok=True)
+                # mkdtemp creates a new directory, so concurrent runs never share one
+                self.output_dir = Path(tempfile.mkdtemp(
+                    prefix=f"{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}_", dir=profile_dir))
+            except OSError as e:
+                logger.error(f"Cannot create profile directory in {profile_dir}, "
+                             f"profiling is disabled")
+                logger.error(e)
+                self.enabled = False
+
+    def stage(self, stage_name: str):
+        """
+        Returns a context manager profiling the wrapped stage, or a shared no-op
+        context manager when profiling is disabled
+        :param stage_name: name of the stage used in the report, e.g. 'extract'
+        """
+        if not self.enabled:
+            return _disabled_stage
+        return self._profile_stage(stage_name)
+
+    @contextmanager
+    def _profile_stage(self, stage_name: str):
+        worker_profiles = []
+        worker_profiles_token = _worker_profiles.set(worker_profiles)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        snapshot_before = tracemalloc.take_snapshot() if self.take_snapshots else None
+        memory_before = tracemalloc.get_traced_memory()[0]
+        profile = cProfile.Profile()
+        start = perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            _worker_profiles.reset(worker_profiles_token)
+            elapsed = perf_counter() - start
+            memory_after, memory_peak = tracemalloc.get_traced_memory()
+            top_lines = []
+            if snapshot_before is not None:
+                snapshot_after = tracemalloc.take_snapshot()
+                top_lines = snapshot_after.filter_traces(_snapshot_filters).compare_to(
+                    snapshot_before.filter_traces(_snapshot_filters), "lineno")[:TOP_LINES_COUNT]
+            if started_tracing:
+                tracemalloc.stop()
+            self._record_stage(stage_name, [profile] + worker_profiles, elapsed,
+                               memory_after - memory_before, memory_peak - memory_before,
+                               top_lines)
+
+    def _record_stage(self, stage_name: str, profiles: list, elapsed: float,
+                      memory_delta: int, memory_peak: int, top_lines: list) -> None:
+        """
+        Stores stage statistics and dumps the merged cProfile data (stage thread and
+        its worker threads) of the stage
+        """
+        try:
+            stage_stats = pstats.Stats(*profiles)
+            stage_stats.dump_stats(str(self.output_dir / f"{stage_name}.prof"))
+            if self.combined_stats is None:
+                self.combined_stats = stage_stats
+            else:
+                self.combined_stats.add(stage_stats)
+            self.stages.append({
+                "name": stage_name,
+                "elapsed": elapsed,
+                "memory_delta": memory_delta,
+                "memory_peak": memory_peak,
+                "top_lines": top_lines,
+            })
+        except Exception as e:
+            logger.error(f"Error while recording profile for stage {stage_name}")
+            logger.error(e, exc_info=True)
+
+    def write_report(self) -> Union[Path, None]:
+        """
+        Writes the run report: hot functions sorted by cumulative time, per stage
+        timings, memory deltas and peaks, and top allocating lines
+        :return: path of the written report, or None if disabled or nothing profiled
+        """
+        if not self.enabled or not self.stages:
+            return
+        try:
+            report = io.StringIO()
+            report.write("Stage timings and memory (tracemalloc)\n")
+            for stage in self.stages:
+                report.write(f"{stage['name']:<40} {stage['elapsed']:>10.3f} s  "
+                             f"delta {stage['memory_delta'] / 1024:>12.1f} KiB  "
+                             f"peak {stage['memory_peak'] / 1024:>12.1f} KiB\n")
+            report.write(f"\nRun peak memory: "
+                         f"{max(stage['memory_peak'] for stage in self.stages) / 1024:.1f} KiB\n")
+            for stage in self.stages:
+                report.write(f"\nTop allocating lines - {stage['name']}\n")
+                for line_stat in stage["top_lines"]:
+                    report.write(f"{line_stat}\n")
+            report.write("\nHot functions (all stages, sorted by cumulative time)\n")
+            self.combined_stats.stream = report
+            self.combined_stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+                TOP_FUNCTIONS_COUNT)
+            report_path = self.output_dir / "report.txt"
+            report_path.write_text(report.getvalue())
+            logger.info(f"Profile report written to {report_path}")
+            return report_path
+        except Exception as e:
+            logger.error("Error while writing profile report: Please contact dev team")
+            logger.error(e, exc_info=True)
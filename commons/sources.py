@@ -0,0 +1,102 @@
+""" Source registry for the project, every generation data source is described by
+    config instead of having its own hard-wired extract/transform/load methods
+"""
+import json
+import re
+from os import environ
+from typing import Union
+from commons.logging import logger
+from commons.util import get_source_timezones, is_valid_timezone, UNIX_TIMESTAMP
+
+
+PAYLOAD_FORMATS = ("json", "csv")
+OUTPUT_FORMATS = ("json", "csv")
+SOURCE_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
+
+# Default registry, same sources which were previously hard-wired in the pipeline.
+# `timezone` is optional and falls back to `get_source_timezones` for the source
+DEFAULT_SOURCES = [
+    {
+        "name": "solar",
+        "url_template": "/{date}/renewables/solargen.json",
+        "payload_format": "json",
+        "output_format": "json",
+    },
+    {
+        "name": "wind",
+        "url_template": "/{date}/renewables/windgen.csv",
+        "payload_format": "csv",
+        "output_format": "csv",
+    },
+]
+
+
+def validate_source(source: dict) -> Union[dict, None]:
+    """
+    Validates a source config and fills in its defaults
+    :param source: source config with keys `name`, `url_template`, `payload_format`,
+        `output_format` and optional `timezone`(`unix` or timezone name)
+    :return: complete source config, or None if the config is not valid
+    """
+    if not isinstance(source, dict):
+        logger.error(f"Error in source registry: source config({source}) is not a dict")
+        return
+    name = source.get("name")
+    if not isinstance(name, str) or not SOURCE_NAME_PATTERN.match(name):
+        logger.error(f"Error in source registry: source name({name}) should be snake_case")
+        return
+    if "{date}" not in str(source.get("url_template")):
+        logger.error(f"Error in source registry: url_template of {name} should "
+                     f"contain '{{date}}'")
+        return
+    payload_format = source.get("payload_format", "json")
+    output_format = source.get("output_format", payload_format)
+    if payload_format not in PAYLOAD_FORMATS or output_format not in OUTPUT_FORMATS:
+        logger.error(f"Error in source registry: unknown payload({payload_format}) or "
+                     f"output({output_format}) format for {name}")
+        return
+    timezone_name = source.get("timezone") or get_source_timezones().get(name, "UTC")
+    if timezone_name != UNIX_TIMESTAMP and not is_valid_timezone(timezone_name):
+        logger.error(f"Error in source registry: unknown timezone({timezone_name}) for {name}")
+        return
+    return {
+        "name": name,
+        "url_template": source["url_template"],
+        "payload_format": payload_format,
+        "output_format": output_format,
+        "timezone": timezone_name,
+    }
+
+
+def load_source_registry(config_path: str = None) -> list:
+    """
+    Loads the source registry from a JSON config file (a list of source configs),
+    default registry is used if no config is provided via param or env var SOURCES_CONFIG
+    :param config_path: path of the JSON config file
+    :return: list of valid source configs, invalid or duplicate ones are skipped
+    """
+    config_path = config_path or environ.get("SOURCES_CONFIG")
+    sources = DEFAULT_SOURCES
+    if config_path:
+        try:
+            with open(config_path) as config_file:
+                sources = json.load(config_file)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error while reading sources config({config_path}): "
+                         f"Please contact dev team")
+            logger.error(e)
+            return []
+        if not isinstance(sources, list):
+            logger.error(f"Error in sources config({config_path}): expected a list of sources")
+            return []
+
+    registry = []
+    for source in sources:
+        source = validate_source(source)
+        if not source:
+            continue
+        if source["name"] in [item["name"] for item in registry]:
+            logger.warning(f"Duplicate source {source['name']} in sources config, skipping it")
+            continue
+        registry.append(source)
+    return registry
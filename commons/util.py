@@ -1,9 +1,12 @@
 """ Utility methods file, where misc methods can be defined to avoid
     code duplication
 """
+import re
 from os import environ
 from typing import Any, Union
 from datetime import date, timedelta, datetime, timezone
+import numpy as np
+import pandas as pd
 import requests
 from requests.adapters import HTTPAdapter, Retry
 from commons.logging import logger
@@ -15,10 +18,56 @@ AWS Secretsmanager, Parameters, etc. as per the requirements."""
 api_key = environ.get("API_KEY")
 server_url = environ.get("API_SERVER_URL")
 
+DEFAULT_MAX_WORKERS = 8
+
+
+def get_max_workers() -> int:
+    """
+    This util function returns the number of workers fetching sources concurrently from
+    env var MAX_WORKERS, falling back to the default if it is not a positive integer
+    """
+    value = environ.get("MAX_WORKERS")
+    if value is None:
+        return DEFAULT_MAX_WORKERS
+    try:
+        workers = int(value)
+        if workers > 0:
+            return workers
+    except ValueError:
+        pass
+    logger.warning(f"MAX_WORKERS({value}) should be a positive integer, "
+                   f"using default {DEFAULT_MAX_WORKERS}")
+    return DEFAULT_MAX_WORKERS
+
+
+# Number of workers fetching sources concurrently, also the size of the shared
+# connection pool so all sources together never open more connections than this
+max_workers = get_max_workers()
+
 # Declaring request session handler with retry configuration, current retries - 5
 session = requests.Session()
 retries = Retry(total=5, backoff_factor=1, status_forcelist=[429])
-session.mount('http://', HTTPAdapter(max_retries=retries))
+adapter = HTTPAdapter(max_retries=retries, pool_maxsize=max_workers, pool_block=True)
+session.mount('http://', adapter)
+session.mount('https://', adapter)
+
+# Timestamp semantics per source: `unix` for epoch (seconds/milliseconds) timestamps,
+# otherwise an IANA zone name in which naive wall-clock timestamps are expressed.
+# Can be overridden with env var SOURCE_TIMEZONES e.g. 'solar=unix,wind=Europe/Berlin'
+UNIX_TIMESTAMP = "unix"
+DEFAULT_SOURCE_TIMEZONES = {"solar": UNIX_TIMESTAMP, "wind": "UTC"}
+
+# DST policies, `ambiguous` is applied to repeated wall-clock times (clocks going back)
+# and `nonexistent` to skipped ones (clocks going forward); overridable with env vars
+# DST_AMBIGUOUS_POLICY and DST_NONEXISTENT_POLICY
+AMBIGUOUS_POLICIES = ("earliest", "latest", "NaT", "raise")
+NONEXISTENT_POLICIES = ("shift_forward", "shift_backward", "NaT", "raise")
+DEFAULT_AMBIGUOUS_POLICY = "earliest"
+DEFAULT_NONEXISTENT_POLICY = "shift_forward"
+
+TIMEZONE_OFFSET_PATTERN = r"(?:[+-]\d{2}:?\d{2}|Z)$"
+FIXED_OFFSET_PATTERN = re.compile(r"[+-]\d{2}:\d{2}")
+MAX_GROUPED_OFFSETS = 48
 
 
 def get_latest_week_date_range(latest_date: str = None) -> Union[list, None]:
@@ -57,9 +106,9 @@ def request_api_call(api_base_url: str = "/status") -> Any:
         response = session.get(api_url)
         if response.status_code == 200:
             if response.headers.get("content-type") == "text/csv":
-                response = session.get(api_url).text
+                response = response.text
             elif response.headers.get("content-type") == "application/json":
-                response = session.get(api_url).json()
+                response = response.json()
             else:
                 logger.warning("Unknown content type is returned from the API, "
                                "might hamper data integrity")
@@ -67,7 +116,7 @@ def request_api_call(api_base_url: str = "/status") -> Any:
             return response
         else:
             logger.warning(f"API request is failed, request code:{response.status_code}")
-            logger.info(session.get(api_url).text)
+            logger.info(response.text)
             return
 
     except Exception as e:
@@ -96,6 +145,17 @@ def get_wind_data(date_value):
     )
 
 
+def get_source_data(source: dict, date_value: str) -> Any:
+    """
+    Calling backend API of any registered source on any given date
+    :param source: source config from the source registry
+    :param date_value: YYYY-MM-DD formatted date string
+    """
+    return request_api_call(
+        api_base_url=source["url_template"].format(date=date_value)
+    )
+
+
 def convert_naive_timestamp_to_utc_datetime(timestamp: [str, int, float]) -> Union[str, None]:
     """
     This util function converts given naive timestamp format(Unix) to utc datetime string
@@ -131,6 +191,184 @@ def convert_utc_datetime_to_naive_datetime(datetime_str: str) -> Union[str, None
         logger.error("Wrong format provided in convert_utc_datetime_to_naive_datetime method")
 
 
+def get_source_timezones() -> dict:
+    """
+    This util function returns the timestamp semantics (`unix` or a timezone name)
+    of every source, defaults are overridden by env var SOURCE_TIMEZONES with
+    format 'source=timezone,source=timezone'
+    """
+    source_timezones = dict(DEFAULT_SOURCE_TIMEZONES)
+    for item in environ.get("SOURCE_TIMEZONES", "").split(","):
+        source, _, timezone_name = item.partition("=")
+        if source.strip() and timezone_name.strip():
+            source_timezones[source.strip().lower()] = timezone_name.strip()
+    return source_timezones
+
+
+def get_dst_policies() -> tuple:
+    """
+    This util function returns the (ambiguous, nonexistent) DST policies, read from
+    env vars DST_AMBIGUOUS_POLICY and DST_NONEXISTENT_POLICY or the defaults
+    """
+    return (environ.get("DST_AMBIGUOUS_POLICY", DEFAULT_AMBIGUOUS_POLICY),
+            environ.get("DST_NONEXISTENT_POLICY", DEFAULT_NONEXISTENT_POLICY))
+
+
+def is_valid_timezone(timezone_name: str) -> bool:
+    """
+    This util function checks if pandas can localize timestamps to the given zone
+    :param timezone_name: IANA timezone name e.g. 'Europe/Berlin'
+    """
+    try:
+        pd.Timestamp("2024-01-01").tz_localize(timezone_name)
+        return True
+    except Exception:
+        return False
+
+
+def _format_datetimes(datetimes: pd.Series, suffix: str = "") -> pd.Series:
+    """
+    Formats a datetime column as '%Y-%m-%d %H:%M:%S' strings, numpy formats the whole
+    array at once while `dt.strftime` and `astype(str)` go element by element
+    :param datetimes: Series of (UTC or naive) datetimes, truncated to seconds
+    :param suffix: appended to every formatted value e.g. '+00:00'
+    """
+    naive = datetimes.dt.tz_convert(None) if datetimes.dt.tz is not None else datetimes
+    formatted = pd.Series(np.datetime_as_string(
+        naive.to_numpy(dtype="datetime64[s]"), unit="s"), index=datetimes.index)
+    formatted = formatted.str.replace("T", " ", n=1, regex=False)
+    return (formatted + suffix).where(datetimes.notna())
+
+
+def _unix_timestamps_to_utc(timestamps: pd.Series) -> pd.Series:
+    """
+    Vectorized version of `convert_naive_timestamp_to_utc_datetime`, 13 digit values
+    are treated as milliseconds and everything else as seconds
+    :param timestamps: Series of naive Unix timestamps
+    """
+    numeric = pd.to_numeric(timestamps, errors="coerce")
+    is_milliseconds = numeric.abs().between(1e12, 1e13, inclusive="left")
+    milliseconds = numeric.where(is_milliseconds, np.trunc(numeric) * 1000)
+    return pd.to_datetime(milliseconds, unit="ms", utc=True, errors="coerce")
+
+
+def _local_timestamps_to_utc(timestamps: pd.Series, timezone_name: str,
+                             ambiguous: str, nonexistent: str) -> pd.Series:
+    """
+    Converts wall-clock datetime strings of one timezone to UTC, strings which already
+    carry an offset are converted directly and naive ones are localized first
+    :param timestamps: Series of datetime strings
+    :param timezone_name: IANA timezone name the naive values are expressed in
+    :param ambiguous: one of AMBIGUOUS_POLICIES
+    :param nonexistent: one of NONEXISTENT_POLICIES
+    """
+    if ambiguous not in AMBIGUOUS_POLICIES or nonexistent not in NONEXISTENT_POLICIES:
+        raise ValueError(f"Unknown DST policy provided: ambiguous({ambiguous}), "
+                         f"nonexistent({nonexistent})")
+    timestamps = timestamps.astype(str)
+    has_offset = timestamps.str.contains(TIMEZONE_OFFSET_PATTERN, regex=True)
+    if has_offset.all():  # Columns are usually all aware or all naive, skips masking
+        return _aware_timestamps_to_utc(timestamps)
+    if not has_offset.any():
+        return _naive_timestamps_to_utc(timestamps, timezone_name, ambiguous, nonexistent)
+    result = pd.Series(pd.NaT, index=timestamps.index, dtype="datetime64[ns, UTC]")
+    result[has_offset] = _aware_timestamps_to_utc(timestamps[has_offset])
+    result[~has_offset] = _naive_timestamps_to_utc(
+        timestamps[~has_offset], timezone_name, ambiguous, nonexistent)
+    return result
+
+
+def _aware_timestamps_to_utc(timestamps: pd.Series) -> pd.Series:
+    """
+    Converts ISO 8601 datetime strings carrying an offset to UTC. A column holds only a
+    few distinct offsets, so the wall-clock part is parsed naive (pandas 2.0 parses
+    offsets element by element) and each '+HH:MM' offset is subtracted per group
+    """
+    offsets = timestamps.str[-6:]
+    unique_offsets = offsets.unique()
+    if len(unique_offsets) > MAX_GROUPED_OFFSETS or not all(
+            FIXED_OFFSET_PATTERN.fullmatch(str(offset)) for offset in unique_offsets):
+        return pd.to_datetime(timestamps, format="ISO8601", errors="coerce", utc=True)
+    if len(unique_offsets) == 1:
+        return _offset_group_to_utc(timestamps, unique_offsets[0])
+    result = pd.Series(pd.NaT, index=timestamps.index, dtype="datetime64[ns, UTC]")
+    for offset in unique_offsets:
+        is_offset = offsets == offset
+        result[is_offset] = _offset_group_to_utc(timestamps[is_offset], offset)
+    return result
+
+
+def _offset_group_to_utc(timestamps: pd.Series, offset: str) -> pd.Series:
+    """
+    Converts datetime strings which all end with the same '+HH:MM' offset to UTC
+    """
+    wall_clock = pd.to_datetime(timestamps.str[:-6], format="ISO8601", errors="coerce")
+    sign = 1 if offset[0] == "+" else -1
+    delta = pd.Timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6])) * sign
+    return (wall_clock - delta).dt.tz_localize("UTC")
+
+
+def _naive_timestamps_to_utc(timestamps: pd.Series, timezone_name: str,
+                             ambiguous: str, nonexistent: str) -> pd.Series:
+    """
+    Localizes naive ISO 8601 datetime strings to the given timezone and converts them to UTC
+    """
+    naive = pd.to_datetime(timestamps, format="ISO8601", errors="coerce")
+    if ambiguous in ("earliest", "latest"):
+        # pandas flags the first (DST) occurrence of a repeated wall-clock time with True
+        ambiguous = np.full(len(naive), ambiguous == "earliest")
+    # Zone is passed by name so pandas uses its own cached transition tables, a
+    # `ZoneInfo` object is localized element by element on pandas 2.0
+    return naive.dt.tz_localize(
+        timezone_name, ambiguous=ambiguous, nonexistent=nonexistent).dt.tz_convert("UTC")
+
+
+def _to_utc(timestamps: pd.Series, timezone_name: str, ambiguous: str,
+            nonexistent: str) -> pd.Series:
+    """
+    Dispatches timestamps of a single timezone to the matching converter
+    """
+    if timezone_name == UNIX_TIMESTAMP:
+        return _unix_timestamps_to_utc(timestamps)
+    return _local_timestamps_to_utc(timestamps, timezone_name, ambiguous, nonexistent)
+
+
+def convert_timestamps_to_utc(timestamps: pd.Series, timezone_name: Union[str, pd.Series],
+                              ambiguous: str = None, nonexistent: str = None) -> pd.Series:
+    """
+    This util function converts a whole column of naive timestamps to UTC datetime
+    strings at once, wrong values are returned as NaN instead of failing the column.
+    :param timestamps: Series of naive timestamps
+    :param timezone_name: `unix` for epoch timestamps or IANA timezone name of the
+        wall-clock values; a Series of names (aligned with timestamps) converts
+        multi-region batches zone by zone
+    :param ambiguous: DST policy for repeated wall-clock times (default from env)
+    :param nonexistent: DST policy for skipped wall-clock times (default from env)
+    """
+    default_ambiguous, default_nonexistent = get_dst_policies()
+    ambiguous = ambiguous or default_ambiguous
+    nonexistent = nonexistent or default_nonexistent
+    if isinstance(timezone_name, pd.Series):
+        result = pd.Series(pd.NaT, index=timestamps.index, dtype="datetime64[ns, UTC]")
+        for zone, zone_timestamps in timestamps.groupby(timezone_name, sort=False):
+            result[zone_timestamps.index] = _to_utc(
+                zone_timestamps, zone, ambiguous, nonexistent)
+    else:
+        result = _to_utc(timestamps, timezone_name, ambiguous, nonexistent)
+    return _format_datetimes(result, suffix="+00:00")
+
+
+def remove_timestamps_timezone(timestamps: pd.Series) -> pd.Series:
+    """
+    Vectorized version of `convert_utc_datetime_to_naive_datetime`, removes timezone
+    info from a column of datetime strings and keeps their wall-clock time; values
+    which are already naive are kept as they are and wrong values become NaN
+    :param timestamps: Series of ISO 8601 datetime strings e.g. %Y-%m-%d %H:%M:%S%z
+    """
+    wall_clock = timestamps.astype(str).str.replace(TIMEZONE_OFFSET_PATTERN, "", regex=True)
+    return _format_datetimes(pd.to_datetime(wall_clock, format="ISO8601", errors="coerce"))
+
+
 def remove_str_whitespaces(string: str) -> Union[str, None]:
     """
     This util function will remove any whitespaces like duplicate space or
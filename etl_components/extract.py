@@ -1,24 +1,62 @@
 import pandas as pd
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import StringIO
-from typing import Union, Tuple
+from typing import Any, Union, Tuple
 
 from pandas import DataFrame
 
-from commons.util import (
-    get_latest_week_date_range, get_solar_data, get_wind_data
-)
+from commons.util import get_latest_week_date_range, get_source_data, max_workers
 from commons.logging import logger
+from commons.profiling import profile_in_worker
+from commons.sources import DEFAULT_SOURCES
 
 
-def extract_generation_data(latest_date: str = None) -> Union[
-        Tuple[DataFrame, DataFrame, list], Tuple[None, None, None]]:
+def parse_source_payload(source: dict, payload: Any) -> Union[DataFrame, None]:
     """
-    Retrieves data for solar and wind generation for last 7 days from the date
-        provide(default today's date)
+    Parses an API payload of a source to a dataframe according to its payload format
+    :param source: source config from the source registry
+    :param payload: API response, parsed json or csv text
+    :return: dataframe of the payload, or None if payload is empty or not parsable
+    """
+    if not payload:
+        return
+    if source["payload_format"] == "csv" and isinstance(payload, str):
+        return pd.read_csv(StringIO(payload), sep=",")
+    if source["payload_format"] == "json" and isinstance(payload, (list, dict)):
+        return pd.DataFrame(payload)
+    logger.warning(f"Payload of {source['name']} doesn't match its "
+                   f"{source['payload_format']} format, skipping it")
+
+
+def _get_source_frame(source: dict, date_value: str, future: Future) -> Union[DataFrame, None]:
+    """
+    Collects and parses the payload of one (source, date) request, errors are logged
+    and the frame is skipped so one bad payload doesn't fail the other sources
+    :param source: source config from the source registry
+    :param date_value: YYYY-MM-DD formatted date string of the request
+    :param future: future of the submitted `get_source_data` call
+    :return: dataframe of the payload, or None if it couldn't be fetched or parsed
+    """
+    try:
+        return parse_source_payload(source, future.result())
+    except Exception as e:
+        logger.error(f"Error while extracting {source['name']} data for {date_value}, "
+                     f"skipping it")
+        logger.error(e, exc_info=True)
+
+
+def extract_sources_data(sources: list, latest_date: str = None) -> Union[
+        Tuple[dict, list], Tuple[None, None]]:
+    """
+    Retrieves data of all registered sources for last 7 days from the date provided
+        (default today's date), all (source, date) requests are fetched over one
+        shared worker pool bounded by `max_workers`, which is also the size of the
+        shared connection pool
+    :param sources: source configs from the source registry
     :param latest_date: use it to provide a date in format 'YYYY-MM-DD' to run
         ETL for that particular week (latest_date - 7 days), otherwise today's
         date would be considered (current latest week)
-    :return: Both dataframes i.e. solar and wind with the date range for which
+    :return: dict of source name to its dataframe with the date range for which
         the data has been extracted; or None if no data found
     """
     try:
@@ -26,16 +64,39 @@ def extract_generation_data(latest_date: str = None) -> Union[
         if not date_range:
             logger.error("Error: Cannot get last 7 days(week) date range")
             raise Exception
-        solar_df = wind_df = pd.DataFrame()
-        for date in date_range:
-            solar_data = get_solar_data(date_value=date)  # This is calling the API while providing date
-            wind_data = get_wind_data(date_value=date)  # This is calling the API while providing date
-            if solar_data:
-                solar_df = pd.concat([solar_df, pd.DataFrame(solar_data)], ignore_index=True)
-            if wind_data:
-                wind_df = pd.concat([wind_df, pd.read_csv(StringIO(wind_data), sep=",")], ignore_index=True)
-        return solar_df, wind_df, date_range
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fetch = profile_in_worker(get_source_data)  # No-op unless a stage is profiled
+            futures = {
+                (source["name"], date): executor.submit(fetch, source, date)
+                for source in sources for date in date_range
+            }
+            source_dfs = {}
+            for source in sources:
+                frames = [_get_source_frame(source, date, futures[(source["name"], date)])
+                          for date in date_range]
+                frames = [frame for frame in frames if frame is not None]
+                source_dfs[source["name"]] = pd.concat(
+                    frames, ignore_index=True) if frames else pd.DataFrame()
+        return source_dfs, date_range
     except Exception as e:
         logger.error("Error in extraction step: Please contact dev team")
         logger.error(e, exc_info=True)
+        return None, None
+
+
+def extract_generation_data(latest_date: str = None) -> Union[
+        Tuple[DataFrame, DataFrame, list], Tuple[None, None, None]]:
+    """
+    Retrieves data for solar and wind generation for last 7 days from the date
+        provide(default today's date), wrapper over `extract_sources_data` for the
+        default sources
+    :param latest_date: use it to provide a date in format 'YYYY-MM-DD' to run
+        ETL for that particular week (latest_date - 7 days), otherwise today's
+        date would be considered (current latest week)
+    :return: Both dataframes i.e. solar and wind with the date range for which
+        the data has been extracted; or None if no data found
+    """
+    source_dfs, date_range = extract_sources_data(DEFAULT_SOURCES, latest_date)
+    if source_dfs is None:
         return None, None, None
+    return source_dfs["solar"], source_dfs["wind"], date_range
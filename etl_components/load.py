@@ -1,61 +1,158 @@
+import sqlite3
+from itertools import islice
 from pathlib import Path
 import pandas as pd
 from commons.logging import logger
 
 
-def write_solar_data(solar_df: pd.DataFrame, date_range: list) -> bool:
+# Columns persisted by the SQLite sink, `utc_timestamp` and `variable` together
+# form the primary key so re-loading the same week upserts instead of duplicating
+SQLITE_COLUMNS = ["utc_timestamp", "variable", "value", "naive_timestamp", "last_modified_utc"]
+SQLITE_BATCH_SIZE = 10000
+
+
+def write_generation_data(df: pd.DataFrame, date_range: list, source_name: str,
+                          output_format: str) -> bool:
     """
-    Writes finally transformed solar data in storage, doesn't return anything
-    :param solar_df: transformed solar generation data dataframe
+    Writes finally transformed generation data of any source in storage, date wise
+    in `generation_output/<source_name>/<latest date>/`
+    :param df: transformed generation data dataframe
     :param date_range: Range of dates for which the data has been processed
-    :return: None
+    :param source_name: name of the source, used as output directory
+    :param output_format: `json` (json lines) or `csv`
+    :return: True if any data has been written, otherwise False
     """
     result = False
     count_flag = 0
     try:
         folder_name = date_range[0]
-        base_dir = f"generation_output/solar/{folder_name}/"
+        base_dir = f"generation_output/{source_name}/{folder_name}/"
         output_dir = Path(base_dir)
         output_dir.mkdir(parents=True, exist_ok=True)  # To prevent non-existing directory error
         # Writing date wise data into separate files
         for date_value in date_range:
-            path = base_dir + date_value + ".json"
-            date_df = solar_df[solar_df["utc_timestamp"].str.contains(date_value)]
+            path = base_dir + date_value + "." + output_format
+            date_df = df[df["utc_timestamp"].str.contains(date_value, na=False)]
             if not date_df.empty:
-                date_df.to_json(path, orient='records', lines=True)
                 count_flag = 1
+                if output_format == "csv":
+                    date_df.to_csv(path, index=False)
+                else:
+                    date_df.to_json(path, orient='records', lines=True)
         if count_flag:
             result = True
     except Exception as e:
-        logger.error("Error while writing solar data: Please contact dev team")
+        logger.error(f"Error while writing {source_name} data: Please contact dev team")
         logger.error(e, exc_info=True)
     return result
 
 
+def write_solar_data(solar_df: pd.DataFrame, date_range: list) -> bool:
+    """
+    Writes finally transformed solar data in storage as json lines
+    :param solar_df: transformed solar generation data dataframe
+    :param date_range: Range of dates for which the data has been processed
+    :return: True if any data has been written, otherwise False
+    """
+    return write_generation_data(solar_df, date_range, "solar", "json")
+
+
 def write_wind_data(wind_df: pd.DataFrame, date_range: list) -> bool:
     """
-    Writes finally transformed wind data in storage, doesn't return anything
+    Writes finally transformed wind data in storage as csv
     :param wind_df: transformed wind dataframe
     :param date_range: Range of dates for which the data has been processed
-    :return: None
+    :return: True if any data has been written, otherwise False
+    """
+    return write_generation_data(wind_df, date_range, "wind", "csv")
+
+
+def write_generation_data_to_sqlite(df: pd.DataFrame, source_name: str, db_path: str,
+                                    batch_size: int = SQLITE_BATCH_SIZE) -> bool:
     """
+    Bulk-loads transformed generation data into a SQLite table, rows are inserted
+    in batches with `executemany` inside one transaction and upserted on the
+    (utc_timestamp, variable) primary key
+    :param df: transformed generation data dataframe
+    :param source_name: name of the source, data is loaded into `<source_name>_generation`
+    :param db_path: path of the SQLite database file, created if not present
+    :param batch_size: number of rows sent to `executemany` per call
+    :return: True if any rows were loaded, otherwise False
+    """
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        return False
+    table_name = f"{source_name}_generation"
+    missing_columns = [col for col in SQLITE_COLUMNS if col not in df.columns]
+    if missing_columns:
+        logger.error(f"Error while loading {table_name} data to SQLite: missing "
+                     f"columns {missing_columns}")
+        return False
+    # Rows without a primary key (e.g. unparsable timestamps) can't be upserted and
+    # would roll back the whole load, so they are skipped like the file writers do
+    key_rows = df["utc_timestamp"].notna() & df["variable"].notna()
+    if not key_rows.all():
+        logger.warning(f"Skipping {(~key_rows).sum()} rows with null utc_timestamp or "
+                       f"variable while loading {table_name} data to SQLite")
+        df = df[key_rows]
+        if df.empty:
+            return False
+
     result = False
-    count_flag = 0
+    connection = None
     try:
-        folder_name = date_range[0]
-        base_dir = f"generation_output/wind/{folder_name}/"
-        output_dir = Path(base_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)  # To prevent non-existing directory error
-        # Writing date wise data into separate files
-        for date_value in date_range:
-            path = base_dir + date_value + ".csv"
-            date_df = wind_df[wind_df["utc_timestamp"].str.contains(date_value)]
-            if not date_df.empty:
-                count_flag = 1
-                date_df.to_csv(path, index=False)
-        if count_flag:
-            result = True
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)  # To prevent non-existing directory error
+        connection = sqlite3.connect(db_path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        # Primary key index leads with `utc_timestamp`, so it also serves as the
+        # index for timestamp range queries, no separate index is needed
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table_name} ("
+            f"utc_timestamp TEXT NOT NULL, variable INTEGER NOT NULL, value REAL, "
+            f"naive_timestamp, last_modified_utc, "
+            f"PRIMARY KEY (utc_timestamp, variable)) WITHOUT ROWID"
+        )
+        insert_query = (
+            f"INSERT INTO {table_name} ({', '.join(SQLITE_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(SQLITE_COLUMNS))}) "
+            f"ON CONFLICT (utc_timestamp, variable) DO UPDATE SET "
+            f"value = excluded.value, naive_timestamp = excluded.naive_timestamp, "
+            f"last_modified_utc = excluded.last_modified_utc"
+        )
+        # `tolist` converts numpy scalars to native python types accepted by sqlite3
+        rows = zip(*(df[col].astype(object).where(df[col].notna(), None).tolist()
+                     for col in SQLITE_COLUMNS))
+        with connection:  # Single transaction, committed once all batches are inserted
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                connection.executemany(insert_query, batch)
+        result = True
     except Exception as e:
-        logger.error("Error while writing wind data: Please contact dev team")
+        logger.error(f"Error while loading {table_name} data to SQLite: Please contact dev team")
         logger.error(e, exc_info=True)
+    finally:
+        if connection is not None:
+            connection.close()
     return result
+
+
+def write_solar_data_to_sqlite(solar_df: pd.DataFrame, db_path: str) -> bool:
+    """
+    Loads finally transformed solar data into the `solar_generation` SQLite table
+    :param solar_df: transformed solar generation data dataframe
+    :param db_path: path of the SQLite database file
+    :return: True if data has been loaded, otherwise False
+    """
+    return write_generation_data_to_sqlite(solar_df, "solar", db_path)
+
+
+def write_wind_data_to_sqlite(wind_df: pd.DataFrame, db_path: str) -> bool:
+    """
+    Loads finally transformed wind data into the `wind_generation` SQLite table
+    :param wind_df: transformed wind dataframe
+    :param db_path: path of the SQLite database file
+    :return: True if data has been loaded, otherwise False
+    """
+    return write_generation_data_to_sqlite(wind_df, "wind", db_path)
@@ -2,8 +2,8 @@ import pandas as pd
 from commons.logging import logger
 from typing import Union
 from commons.util import (
-    convert_naive_timestamp_to_utc_datetime, remove_str_whitespaces,
-    convert_utc_datetime_to_naive_datetime
+    remove_str_whitespaces, convert_timestamps_to_utc, remove_timestamps_timezone,
+    get_source_timezones, UNIX_TIMESTAMP
 )
 
 
@@ -24,42 +24,51 @@ def transform_column_names(df: pd.DataFrame) -> Union[pd.DataFrame, None]:
     return df
 
 
-def transform_solar_data(solar_df: pd.DataFrame) -> Union[pd.DataFrame, None]:
+def transform_generation_data(df: pd.DataFrame, timezone_name: str,
+                              source_name: str = "generation") -> Union[pd.DataFrame, None]:
     """
-    Transform solar data and convert naive timestamps to UTC
-    :param solar_df: solar generation data dataframe
-    :return: transformed solar dataframe
+    Transform generation data of any source and convert naive timestamps to UTC,
+    timezone info (if any) is removed from `naive_timestamp` of non-unix sources
+    :param df: generation data dataframe
+    :param timezone_name: `unix` or timezone name of the naive timestamps
+    :param source_name: name of the source, used in error logs
+    :return: transformed dataframe
     """
-    if not isinstance(solar_df, pd.DataFrame):
+    if not isinstance(df, pd.DataFrame):
         return
-    if solar_df.empty:
-        return solar_df
+    if df.empty:
+        return df
     try:
-        solar_df["utc_timestamp"] = solar_df.apply(
-            lambda row: convert_naive_timestamp_to_utc_datetime(
-                row["naive_timestamp"]), axis=1)
-        return solar_df
+        df["utc_timestamp"] = convert_timestamps_to_utc(df["naive_timestamp"], timezone_name)
+        if timezone_name != UNIX_TIMESTAMP:
+            df["naive_timestamp"] = remove_timestamps_timezone(df["naive_timestamp"])
+        return df
     except Exception as e:
-        logger.error("Error while transforming solar data: Please contact dev team")
+        logger.error(f"Error while transforming {source_name} data: Please contact dev team")
         logger.error(e, exc_info=True)
 
 
-def transform_wind_data(wind_df: pd.DataFrame) -> Union[pd.DataFrame, None]:
+def transform_solar_data(solar_df: pd.DataFrame,
+                         timezone_name: str = None) -> Union[pd.DataFrame, None]:
+    """
+    Transform solar data and convert naive timestamps to UTC
+    :param solar_df: solar generation data dataframe
+    :param timezone_name: `unix` or timezone name of the naive timestamps, defaults
+        to the configured solar timezone (see `get_source_timezones`)
+    :return: transformed solar dataframe
+    """
+    timezone_name = timezone_name or get_source_timezones()["solar"]
+    return transform_generation_data(solar_df, timezone_name, "solar")
+
+
+def transform_wind_data(wind_df: pd.DataFrame,
+                        timezone_name: str = None) -> Union[pd.DataFrame, None]:
     """
     Transform wind data and convert naive timestamps to UTC
     :param wind_df: wind generation data dataframe
+    :param timezone_name: `unix` or timezone name of the naive timestamps, defaults
+        to the configured wind timezone (see `get_source_timezones`)
     :return: transformed wind dataframe
     """
-    if not isinstance(wind_df, pd.DataFrame):
-        return
-    if wind_df.empty:
-        return wind_df
-    try:
-        wind_df["utc_timestamp"] = wind_df["naive_timestamp"]
-        wind_df["naive_timestamp"] = wind_df.apply(
-            lambda row: convert_utc_datetime_to_naive_datetime(
-                row["naive_timestamp"]), axis=1)
-        return wind_df
-    except Exception as e:
-        logger.error("Error while transforming wind data: Please contact dev team")
-        logger.error(e, exc_info=True)
+    timezone_name = timezone_name or get_source_timezones()["wind"]
+    return transform_generation_data(wind_df, timezone_name, "wind")
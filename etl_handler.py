@@ -1,68 +1,86 @@
+from os import environ
 from commons.logging import logger
-from etl_components.extract import extract_generation_data
-from etl_components.transform import (
-    transform_column_names, transform_solar_data, transform_wind_data
-)
-from etl_components.load import write_solar_data, write_wind_data
+from commons.profiling import RunProfiler
+from commons.sources import load_source_registry
+from etl_components.extract import extract_sources_data
+from etl_components.transform import transform_column_names, transform_generation_data
+from etl_components.load import write_generation_data, write_generation_data_to_sqlite
 
 
-def etl_handler(latest_date: str = None) -> None:
+def etl_handler(latest_date: str = None, profile_dir: str = None,
+                sources_config: str = None) -> None:
     """
-    Main function handler to handle ETL(client) pipeline for Solar and Wind
-    generation data for the latest week.
+    Main function handler to handle ETL(client) pipeline for all registered
+    generation data sources (default Solar and Wind) for the latest week.
     :param latest_date: use it to provide a date in format 'YYYY-MM-DD' to run
         ETL for that particular week (latest_date - 7 days), otherwise today's
         date would be considered (current latest week)
+    :param profile_dir: if provided (or env var ETL_PROFILE_DIR is set), every stage
+        is profiled with cProfile and tracemalloc and a report is written there
+    :param sources_config: path of the JSON sources config (or env var SOURCES_CONFIG),
+        otherwise default Solar and Wind sources are processed
     :return: returns None, this is main function to handle the complete ETL pipeline,
         shall change accordingly while deploying in a particular infra service
     """
+    profiler = RunProfiler(profile_dir)
     try:
         skipped_flag = False
+        # Optional SQLite sink, enabled only when a database path is provided
+        sqlite_db_path = environ.get("SQLITE_DB_PATH")
+
+        sources = load_source_registry(sources_config)
+        if not sources:
+            logger.error("No valid sources found in the source registry, terminating pipeline")
+            return
 
         logger.info("Starting ETL Pipeline")
-        logger.info("Stage 1: Starting extraction step for Solar and Wind data")
-        solar_df, wind_df, date_range = extract_generation_data(latest_date)
+        logger.info(f"Stage 1: Starting extraction step for "
+                    f"{', '.join(source['name'].title() for source in sources)} data")
+        with profiler.stage("extract"):
+            source_dfs, date_range = extract_sources_data(sources, latest_date)
         logger.info("Stage 1: Extraction completed")
+        source_dfs = source_dfs or {}
 
-        if solar_df is not None and not solar_df.empty:
-            logger.info("Stage 2A: Transformation step for Solar data")
-            solar_df = transform_column_names(solar_df)
-            transformed_solar_df = transform_solar_data(solar_df)
-            logger.info("Stage 2A: Solar data transformation completed")
+        for stage_number, source in enumerate(sources, start=2):
+            name = source["name"]
+            title = name.title()
+            df = source_dfs.get(name)
 
-            logger.info("Stage 2B: Writing Solar data")
-            is_written = write_solar_data(transformed_solar_df, date_range)
-            if is_written:
-                logger.info("Stage 2B: Completed writing Solar data")
-            else:
+            if df is None or df.empty:
                 skipped_flag = True
-                logger.warning("Error in writing Solar data, "
-                               "please check for possible errors")
+                logger.warning(f"No {name} data found for provided week, "
+                               f"skipping stage {stage_number} for the {title} generation")
+                continue
 
-        else:
-            skipped_flag = True
-            logger.warning("No solar data found for provided week, "
-                           "skipping stage 2 for the Solar generation")
-
-        if wind_df is not None and not wind_df.empty:
-            logger.info("Stage 3A: Transformation step for Wind data")
-            wind_df = transform_column_names(wind_df)
-            transformed_wind_df = transform_wind_data(wind_df)
-            logger.info("Stage 3A: Wind data transformation completed")
+            logger.info(f"Stage {stage_number}A: Transformation step for {title} data")
+            with profiler.stage(f"{name}_transform_column_names"):
+                df = transform_column_names(df)
+            with profiler.stage(f"{name}_transform"):
+                transformed_df = transform_generation_data(df, source["timezone"], name)
+            logger.info(f"Stage {stage_number}A: {title} data transformation completed")
 
-            logger.info("Stage 3B: Writing Wind data")
-            is_written = write_wind_data(transformed_wind_df, date_range)
+            logger.info(f"Stage {stage_number}B: Writing {title} data")
+            with profiler.stage(f"{name}_write"):
+                is_written = write_generation_data(
+                    transformed_df, date_range, name, source["output_format"])
             if is_written:
-                logger.info("Stage 3B: Completed writing Wind data")
+                logger.info(f"Stage {stage_number}B: Completed writing {title} data")
             else:
                 skipped_flag = True
-                logger.warning("Error in writing Wind data, "
+                logger.warning(f"Error in writing {title} data, "
                                "please check for possible errors")
 
-        else:
-            skipped_flag = True
-            logger.warning("No wind data found for provided week, "
-                           "skipping stage 3 for the Wind generation")
+            if sqlite_db_path:
+                logger.info(f"Stage {stage_number}C: Loading {title} data to SQLite")
+                with profiler.stage(f"{name}_sqlite_load"):
+                    is_loaded = write_generation_data_to_sqlite(
+                        transformed_df, name, sqlite_db_path)
+                if is_loaded:
+                    logger.info(f"Stage {stage_number}C: Completed loading {title} data to SQLite")
+                else:
+                    skipped_flag = True
+                    logger.warning(f"Error in loading {title} data to SQLite, "
+                                   "please check for possible errors")
 
         if not skipped_flag:
             logger.info("Finished ETL pipeline successfully")
@@ -73,6 +91,9 @@ def etl_handler(latest_date: str = None) -> None:
     except Exception as e:
         logger.error("Error in ETL pipeline: Please contact dev team")
         logger.error(e, exc_info=True)
+    finally:
+        # Written for failed runs as well, these are the runs which need profiling the most
+        profiler.write_report()
 
 
 if __name__ == "__main__":
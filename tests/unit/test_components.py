@@ -3,8 +3,16 @@ from unittest.mock import patch
 import pandas as pd
 from io import StringIO
 import csv
-from etl_components.extract import extract_generation_data
-from etl_components.load import write_solar_data, write_wind_data
+import os
+import sqlite3
+import tempfile
+from pathlib import Path
+from commons.sources import DEFAULT_SOURCES, validate_source
+from etl_components.extract import extract_generation_data, extract_sources_data
+from etl_components.load import (
+    write_solar_data, write_wind_data, write_solar_data_to_sqlite,
+    write_wind_data_to_sqlite, write_generation_data
+)
 from etl_components.transform import (
     transform_column_names, transform_solar_data, transform_wind_data
 )
@@ -65,12 +73,11 @@ class ComponentsTest(unittest.TestCase):
 
         self.expected_wind_data = output.getvalue()
 
-    @patch("etl_components.extract.get_wind_data")
-    @patch("etl_components.extract.get_solar_data")
-    def test_extract_generation_data(self, mock_solar_data, mock_wind_data):
+    @patch("etl_components.extract.get_source_data")
+    def test_extract_generation_data(self, mock_source_data):
         date = "2024-01-01"
-        mock_solar_data.return_value = self.expected_solar_data_1
-        mock_wind_data.return_value = self.expected_wind_data
+        mock_source_data.side_effect = lambda source, date_value: (
+            self.expected_solar_data_1 if source["name"] == "solar" else self.expected_wind_data)
         solar_df, wind_df, date_range = extract_generation_data(date)
 
         expected_df = pd.DataFrame(self.expected_solar_data_2)
@@ -79,6 +86,50 @@ class ComponentsTest(unittest.TestCase):
         self.assertEqual(True, expected_df.equals(wind_df))
         self.assertEqual(self.expected_week_range, date_range)
 
+    @patch("etl_components.extract.get_source_data")
+    def test_extract_sources_data(self, mock_source_data):
+        sources = [validate_source(source) for source in DEFAULT_SOURCES]
+        mock_source_data.side_effect = lambda source, date_value: (
+            self.expected_solar_data_1 if source["name"] == "solar" else self.expected_wind_data)
+        source_dfs, date_range = extract_sources_data(sources, "2024-01-01")
+
+        expected_df = pd.DataFrame(self.expected_solar_data_2)
+
+        self.assertEqual(14, mock_source_data.call_count)
+        self.assertTrue(expected_df.equals(source_dfs["solar"]))
+        self.assertTrue(expected_df.equals(source_dfs["wind"]))
+        self.assertEqual(self.expected_week_range, date_range)
+
+    @patch("etl_components.extract.get_source_data")
+    def test_extract_sources_data_payload_mismatch(self, mock_source_data):
+        sources = [validate_source(source) for source in DEFAULT_SOURCES]
+        mock_source_data.return_value = self.expected_wind_data
+        source_dfs, _ = extract_sources_data(sources, "2024-01-01")
+        self.assertTrue(source_dfs["solar"].empty)
+        self.assertEqual(7, len(source_dfs["wind"]))
+
+    @patch("etl_components.extract.get_source_data")
+    def test_extract_sources_data_bad_payload(self, mock_source_data):
+        sources = [validate_source(source) for source in DEFAULT_SOURCES]
+
+        def source_data(source, date_value):
+            if source["name"] == "solar":
+                return {"error": "rate limited"}
+            if date_value == "2023-12-31":
+                raise ConnectionError("Connection reset")
+            return self.expected_wind_data
+
+        mock_source_data.side_effect = source_data
+        source_dfs, date_range = extract_sources_data(sources, "2024-01-01")
+        self.assertEqual(self.expected_week_range, date_range)
+        self.assertTrue(source_dfs["solar"].empty)
+        self.assertEqual(6, len(source_dfs["wind"]))
+
+    def test_extract_sources_data_wrong_format(self):
+        source_dfs, date_range = extract_sources_data(DEFAULT_SOURCES, "2024-31-01")
+        self.assertIsNone(source_dfs)
+        self.assertIsNone(date_range)
+
     def test_extract_generation_data_wrong_format(self):
         date = "2024-31-01"
         solar_df, wind_df, date_range = extract_generation_data(date)
@@ -124,6 +175,72 @@ class ComponentsTest(unittest.TestCase):
         is_written = write_wind_data(pd.DataFrame(), [])
         self.assertFalse(is_written)
 
+    def test_write_generation_data(self):
+        current_dir = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)  # Writer uses relative output path
+            try:
+                is_written = write_generation_data(
+                    self.transformed_gen_data, self.expected_week_range, "site_a_wind", "csv")
+                self.assertTrue(is_written)
+                self.assertTrue(Path(
+                    "generation_output/site_a_wind/2024-01-01/2024-01-01.csv").is_file())
+            finally:
+                os.chdir(current_dir)
+
+    def test_write_solar_data_to_sqlite(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = str(Path(temp_dir) / "generation.db")
+            is_loaded = write_solar_data_to_sqlite(self.transformed_gen_data, db_path)
+            self.assertTrue(is_loaded)
+            with sqlite3.connect(db_path) as connection:
+                rows = connection.execute(
+                    "SELECT utc_timestamp, variable, value FROM solar_generation").fetchall()
+                journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+            connection.close()
+            self.assertEqual([('2024-01-01 00:00:00+00:00', 999, 45.7621881297)], rows)
+            self.assertEqual("wal", journal_mode)
+
+    def test_write_wind_data_to_sqlite_upsert(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = str(Path(temp_dir) / "generation.db")
+            self.assertTrue(write_wind_data_to_sqlite(self.transformed_gen_data, db_path))
+            updated_df = self.transformed_gen_data.assign(value=1.5)
+            self.assertTrue(write_wind_data_to_sqlite(updated_df, db_path))
+            with sqlite3.connect(db_path) as connection:
+                rows = connection.execute(
+                    "SELECT utc_timestamp, variable, value FROM wind_generation").fetchall()
+            connection.close()
+            self.assertEqual([('2024-01-01 00:00:00+00:00', 999, 1.5)], rows)
+
+    def test_write_solar_data_to_sqlite_null_keys(self):
+        bad_row = self.transformed_gen_data.assign(variable=1, utc_timestamp=None)
+        df = pd.concat([self.transformed_gen_data, bad_row], ignore_index=True)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = str(Path(temp_dir) / "generation.db")
+            is_loaded = write_solar_data_to_sqlite(df, db_path)
+            self.assertTrue(is_loaded)
+            with sqlite3.connect(db_path) as connection:
+                rows = connection.execute(
+                    "SELECT utc_timestamp, variable FROM solar_generation").fetchall()
+            connection.close()
+            self.assertEqual([('2024-01-01 00:00:00+00:00', 999)], rows)
+            self.assertFalse(write_solar_data_to_sqlite(bad_row, db_path))
+
+    def test_write_solar_data_to_sqlite_missing_columns(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = str(Path(temp_dir) / "generation.db")
+            is_loaded = write_solar_data_to_sqlite(self.solar_data_sample_df, db_path)
+            self.assertFalse(is_loaded)
+
+    def test_write_solar_data_to_sqlite_none(self):
+        is_loaded = write_solar_data_to_sqlite(None, None)
+        self.assertFalse(is_loaded)
+
+    def test_write_wind_data_to_sqlite_empty(self):
+        is_loaded = write_wind_data_to_sqlite(pd.DataFrame(), "generation.db")
+        self.assertFalse(is_loaded)
+
     def test_transform_column_names(self):
         df = pd.DataFrame(self.expected_solar_data_1)
         new_df = transform_column_names(df)
@@ -0,0 +1,104 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+
+from commons.util import session, max_workers
+from commons.sources import DEFAULT_SOURCES
+from etl_components.extract import extract_sources_data
+from etl_handler import etl_handler
+
+
+class HandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        # Writers use relative output paths, so every test runs in its own directory
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        current_dir = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        self.addCleanup(os.chdir, current_dir)
+
+        self.sources_config = Path(self.temp_dir.name) / "sources.json"
+        self.sources_config.write_text(json.dumps([
+            DEFAULT_SOURCES[0],
+            {"name": "empty_site", "url_template": "/{date}/sites/empty.json",
+             "payload_format": "json"},
+            {"name": "site_a_wind", "url_template": "/{date}/sites/a/windgen.csv",
+             "payload_format": "csv", "output_format": "json",
+             "timezone": "Europe/Berlin"},
+        ]))
+
+    @staticmethod
+    def source_data(source, date_value):
+        if source["name"] == "solar":
+            return [{"Naive_Timestamp ": 1704585600000, " Variable": 999,
+                     "value": 45.7621881297, "Last Modified utc": 1704585600000}]
+        if source["name"] == "site_a_wind":
+            return ("Naive_Timestamp , Variable,value,Last Modified utc\n"
+                    f"{date_value} 12:00:00,761,-29.28958042287806,{date_value} 12:00:00\n")
+        return None
+
+    @patch("etl_components.extract.get_source_data")
+    def test_etl_handler_sources_config(self, mock_source_data):
+        mock_source_data.side_effect = self.source_data
+        with patch.dict("etl_handler.environ", {"SQLITE_DB_PATH": "generation.db"}):
+            with self.assertLogs("ETL Logger", level="INFO") as logs:
+                etl_handler("2024-01-07", sources_config=str(self.sources_config))
+        messages = [record.getMessage() for record in logs.records]
+
+        self.assertIn("Stage 2B: Completed writing Solar data", messages)
+        self.assertIn("No empty_site data found for provided week, "
+                      "skipping stage 3 for the Empty_Site generation", messages)
+        self.assertIn("Stage 4A: Transformation step for Site_A_Wind data", messages)
+        self.assertIn("Stage 4C: Completed loading Site_A_Wind data to SQLite", messages)
+
+        self.assertTrue(Path("generation_output/solar/2024-01-07/2024-01-07.json").is_file())
+        self.assertFalse(Path("generation_output/empty_site").exists())
+        wind_files = sorted(Path("generation_output/site_a_wind/2024-01-07").iterdir())
+        self.assertEqual(7, len(wind_files))
+        self.assertTrue(all(path.suffix == ".json" for path in wind_files))
+
+        with sqlite3.connect("generation.db") as connection:
+            rows = connection.execute(
+                "SELECT utc_timestamp, naive_timestamp FROM site_a_wind_generation "
+                "ORDER BY utc_timestamp").fetchall()
+        connection.close()
+        self.assertEqual(7, len(rows))
+        self.assertEqual(("2024-01-01 11:00:00+00:00", "2024-01-01 12:00:00"), rows[0])
+
+    @patch("etl_components.extract.max_workers", 2)
+    @patch("etl_components.extract.get_source_data")
+    def test_extract_sources_data_bounded_workers(self, mock_source_data):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def source_data(source, date_value):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return self.source_data(source, date_value)
+
+        mock_source_data.side_effect = source_data
+        source_dfs, _ = extract_sources_data(DEFAULT_SOURCES, "2024-01-07")
+        self.assertEqual(14, mock_source_data.call_count)
+        self.assertEqual(2, peak[0])
+        self.assertEqual(7, len(source_dfs["solar"]))
+
+    def test_session_pool_bounded(self):
+        for prefix in ("http://", "https://"):
+            adapter = session.get_adapter(prefix)
+            self.assertEqual(max_workers, adapter._pool_maxsize)
+            self.assertTrue(adapter._pool_block)
+
+
+if __name__ == '__main__':
+    unittest.main()
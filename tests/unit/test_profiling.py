@@ -0,0 +1,127 @@
+import pstats
+import threading
+import unittest
+import tempfile
+from unittest.mock import patch
+from pathlib import Path
+
+from commons.profiling import RunProfiler, profile_in_worker
+from commons.sources import DEFAULT_SOURCES
+from etl_components.extract import extract_sources_data
+from etl_handler import etl_handler
+
+
+class ProfilingTest(unittest.TestCase):
+
+    @patch.dict("commons.profiling.environ", {}, clear=True)
+    def test_run_profiler_disabled(self):
+        profiler = RunProfiler()
+        self.assertFalse(profiler.enabled)
+        with profiler.stage("extract"):
+            pass
+        self.assertIs(profiler.stage("extract"), profiler.stage("transform"))
+        self.assertListEqual([], profiler.stages)
+        self.assertIsNone(profiler.write_report())
+
+    def test_run_profiler_enabled(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            profiler = RunProfiler(temp_dir)
+            with profiler.stage("extract"):
+                data = [str(i) for i in range(10000)]
+            with profiler.stage("transform"):
+                sorted(data)
+            report_path = profiler.write_report()
+
+            self.assertListEqual(["extract", "transform"],
+                                 [stage["name"] for stage in profiler.stages])
+            self.assertGreater(profiler.stages[0]["memory_delta"], 0)
+            self.assertTrue(Path(report_path).is_file())
+            self.assertTrue((report_path.parent / "extract.prof").is_file())
+            report = Path(report_path).read_text()
+            self.assertIn("Top allocating lines - extract", report)
+            self.assertIn("Hot functions", report)
+
+    def test_run_profiler_env_enabled(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.dict("commons.profiling.environ", {"ETL_PROFILE_DIR": temp_dir}):
+                profiler = RunProfiler()
+            self.assertTrue(profiler.enabled)
+            self.assertEqual(Path(temp_dir), profiler.output_dir.parent)
+            self.assertTrue(profiler.output_dir.is_dir())
+
+    @patch.dict("commons.profiling.environ", {"ETL_PROFILE_SNAPSHOTS": "0"})
+    def test_run_profiler_without_snapshots(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            profiler = RunProfiler(temp_dir)
+            with profiler.stage("extract"):
+                data = [str(i) for i in range(10000)]
+            self.assertListEqual([], profiler.stages[0]["top_lines"])
+            self.assertGreater(profiler.stages[0]["memory_delta"], 0)
+            self.assertIsNotNone(profiler.write_report())
+            del data
+
+    @patch("commons.util.request_api_call", return_value=None)
+    def test_run_profiler_worker_threads(self, _):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            profiler = RunProfiler(temp_dir)
+            with profiler.stage("extract"):
+                extract_sources_data(DEFAULT_SOURCES, "2024-01-01")
+            stats = pstats.Stats(str(profiler.output_dir / "extract.prof"))
+            # (total calls) of `get_source_data`, which only runs in worker threads
+            call_counts = [value[1] for (_, _, function), value in stats.stats.items()
+                           if function == "get_source_data"]
+            self.assertListEqual([14], call_counts)
+
+    @patch("commons.util.request_api_call", return_value=[{"value": 1}])
+    def test_run_profiler_same_data(self, _):
+        source_dfs, _ = extract_sources_data(DEFAULT_SOURCES, "2024-01-01")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            profiler = RunProfiler(temp_dir)
+            with profiler.stage("extract"):
+                profiled_source_dfs, _ = extract_sources_data(DEFAULT_SOURCES, "2024-01-01")
+        self.assertEqual(7, len(source_dfs["solar"]))
+        self.assertTrue(source_dfs["solar"].equals(profiled_source_dfs["solar"]))
+
+    @patch("commons.profiling._PROFILE_PER_THREAD", True)
+    def test_profile_in_worker_other_profiler_active(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            profiler = RunProfiler(temp_dir)
+            with profiler.stage("extract"):
+                wrapped = profile_in_worker(sorted)
+                with patch("commons.profiling.cProfile.Profile.enable",
+                           side_effect=ValueError("Another profiling tool is already active")):
+                    self.assertListEqual([1, 2], wrapped([2, 1]))
+
+    def test_profile_in_worker_disabled(self):
+        self.assertIs(sorted, profile_in_worker(sorted))
+
+    def test_profile_in_worker_other_context(self):
+        wrapped = {}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            profiler = RunProfiler(temp_dir)
+            with profiler.stage("extract"), patch("commons.profiling._PROFILE_PER_THREAD", True):
+                self.assertIsNot(sorted, profile_in_worker(sorted))
+                # A thread which isn't running a profiled stage doesn't see this stage
+                thread = threading.Thread(
+                    target=lambda: wrapped.update(func=profile_in_worker(sorted)))
+                thread.start()
+                thread.join()
+        self.assertIs(sorted, wrapped["func"])
+        self.assertIs(sorted, profile_in_worker(sorted))
+
+    def test_run_profiler_unique_output_dir(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.assertNotEqual(RunProfiler(temp_dir).output_dir,
+                                RunProfiler(temp_dir).output_dir)
+
+    @patch("etl_handler.extract_sources_data", side_effect=RuntimeError("API down"))
+    def test_etl_handler_failed_run_writes_report(self, _):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            etl_handler("2024-01-01", profile_dir=temp_dir)
+            reports = list(Path(temp_dir).glob("*/report.txt"))
+            self.assertEqual(1, len(reports))
+            self.assertIn("extract", reports[0].read_text())
+
+
+if __name__ == '__main__':
+    unittest.main()
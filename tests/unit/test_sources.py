@@ -0,0 +1,67 @@
+import json
+import unittest
+import tempfile
+from unittest.mock import patch
+from pathlib import Path
+
+from commons.sources import load_source_registry, validate_source, DEFAULT_SOURCES
+
+
+class SourcesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.site_source = {
+            "name": "site_a_wind",
+            "url_template": "/{date}/sites/a/windgen.csv",
+            "payload_format": "csv",
+            "timezone": "Europe/Berlin",
+        }
+
+    @patch.dict("commons.sources.environ", {}, clear=True)
+    def test_load_source_registry_default(self):
+        registry = load_source_registry()
+        self.assertListEqual(["solar", "wind"], [source["name"] for source in registry])
+        self.assertListEqual(["unix", "UTC"], [source["timezone"] for source in registry])
+        self.assertEqual(len(DEFAULT_SOURCES), len(registry))
+
+    def test_load_source_registry_config(self):
+        invalid_source = {"name": "Site B", "url_template": "/sites/b.json"}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "sources.json"
+            config_path.write_text(json.dumps(
+                [self.site_source, invalid_source, self.site_source]))
+            registry = load_source_registry(str(config_path))
+        self.assertListEqual([{
+            "name": "site_a_wind",
+            "url_template": "/{date}/sites/a/windgen.csv",
+            "payload_format": "csv",
+            "output_format": "csv",
+            "timezone": "Europe/Berlin",
+        }], registry)
+
+    def test_load_source_registry_missing_config(self):
+        registry = load_source_registry("missing_sources.json")
+        self.assertListEqual([], registry)
+
+    def test_validate_source_wrong_format(self):
+        source = dict(self.site_source, payload_format="xml")
+        self.assertIsNone(validate_source(source))
+
+    def test_validate_source_missing_date(self):
+        source = dict(self.site_source, url_template="/sites/a/windgen.csv")
+        self.assertIsNone(validate_source(source))
+
+    def test_validate_source_unknown_timezone(self):
+        source = dict(self.site_source, timezone="Europe/Berlinn")
+        self.assertIsNone(validate_source(source))
+
+    def test_validate_source_unix_timezone(self):
+        source = dict(self.site_source, timezone="unix")
+        self.assertEqual("unix", validate_source(source)["timezone"])
+
+    def test_validate_source_none(self):
+        self.assertIsNone(validate_source(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,14 @@
 import unittest
 from unittest.mock import patch
 from datetime import datetime
+import pandas as pd
 
 from commons.util import (
     get_date_today, remove_str_whitespaces, convert_utc_datetime_to_naive_datetime,
     convert_naive_timestamp_to_utc_datetime, get_wind_data, get_solar_data,
-    get_latest_week_date_range, request_api_call
+    get_latest_week_date_range, request_api_call, convert_timestamps_to_utc,
+    remove_timestamps_timezone, get_source_timezones, is_valid_timezone, get_source_data,
+    get_max_workers, DEFAULT_MAX_WORKERS
 )
 
 
@@ -103,6 +106,91 @@ class UtilTest(unittest.TestCase):
         new_datetime_str = convert_naive_timestamp_to_utc_datetime(timestamp_str)
         self.assertIsNone(new_datetime_str)
 
+    def test_convert_timestamps_to_utc_unix(self):
+        timestamps = pd.Series(["1704602536", 1704602536000, "Wrong Timestamp Format"])
+        utc_timestamps = convert_timestamps_to_utc(timestamps, "unix")
+        self.assertEqual(["2024-01-07 04:42:16+00:00"] * 2, utc_timestamps[:2].tolist())
+        self.assertTrue(pd.isna(utc_timestamps[2]))
+
+    def test_convert_timestamps_to_utc_local(self):
+        timestamps = pd.Series(["2024-01-07 00:00:00", "2024-07-07 00:00:00",
+                                "2024-01-07 00:00:00+00:00"])
+        utc_timestamps = convert_timestamps_to_utc(timestamps, "Europe/Berlin")
+        self.assertEqual(["2024-01-06 23:00:00+00:00", "2024-07-06 22:00:00+00:00",
+                          "2024-01-07 00:00:00+00:00"], utc_timestamps.tolist())
+
+    def test_convert_timestamps_to_utc_mixed_iso_formats(self):
+        timestamps = pd.Series(["2024-01-07 00:00:00", "2024-01-07 01:00", "2024-01-07T02:00:00",
+                                "2024-01-07T03:00:00+01:00", "2024-01-07 03:00+01:00"])
+        utc_timestamps = convert_timestamps_to_utc(timestamps, "Europe/Berlin")
+        self.assertEqual(["2024-01-06 23:00:00+00:00", "2024-01-07 00:00:00+00:00",
+                          "2024-01-07 01:00:00+00:00", "2024-01-07 02:00:00+00:00",
+                          "2024-01-07 02:00:00+00:00"], utc_timestamps.tolist())
+
+    def test_convert_timestamps_to_utc_offsets(self):
+        timestamps = pd.Series(["2024-01-07 00:00:00+00:00", "2024-01-07 05:30:00+05:30",
+                                "2024-01-06 19:00:00-05:00", "2024-01-07 00:00:00+00:00"])
+        expected = ["2024-01-07 00:00:00+00:00"] * 4
+        self.assertEqual(expected, convert_timestamps_to_utc(timestamps, "UTC").tolist())
+        # Offsets other than '+HH:MM' fall back to parsing every value with its offset
+        timestamps[1] = "2024-01-07T00:00:00Z"
+        self.assertEqual(expected, convert_timestamps_to_utc(timestamps, "UTC").tolist())
+
+    def test_convert_timestamps_to_utc_midnight_only(self):
+        timestamps = pd.Series([1704585600, 1704672000])
+        utc_timestamps = convert_timestamps_to_utc(timestamps, "unix")
+        self.assertEqual(["2024-01-07 00:00:00+00:00", "2024-01-08 00:00:00+00:00"],
+                         utc_timestamps.tolist())
+
+    def test_convert_timestamps_to_utc_dst_policies(self):
+        # 02:30 is skipped on 2024-03-31 and repeated on 2024-10-27 in Europe/Berlin
+        timestamps = pd.Series(["2024-03-31 02:30:00", "2024-10-27 02:30:00"])
+        earliest = convert_timestamps_to_utc(
+            timestamps, "Europe/Berlin", ambiguous="earliest", nonexistent="shift_forward")
+        self.assertEqual(["2024-03-31 01:00:00+00:00", "2024-10-27 00:30:00+00:00"],
+                         earliest.tolist())
+        latest = convert_timestamps_to_utc(
+            timestamps, "Europe/Berlin", ambiguous="latest", nonexistent="NaT")
+        self.assertTrue(pd.isna(latest[0]))
+        self.assertEqual("2024-10-27 01:30:00+00:00", latest[1])
+        with self.assertRaises(Exception):
+            convert_timestamps_to_utc(timestamps, "Europe/Berlin", nonexistent="raise")
+
+    def test_convert_timestamps_to_utc_multi_region(self):
+        timestamps = pd.Series(["2024-01-07 00:00:00", "2024-01-07 00:00:00", "1704585600"])
+        timezones = pd.Series(["America/New_York", "Asia/Kolkata", "unix"])
+        utc_timestamps = convert_timestamps_to_utc(timestamps, timezones)
+        self.assertEqual(["2024-01-07 05:00:00+00:00", "2024-01-06 18:30:00+00:00",
+                          "2024-01-07 00:00:00+00:00"], utc_timestamps.tolist())
+
+    def test_remove_timestamps_timezone(self):
+        timestamps = pd.Series(["2024-01-01 23:00:09+00:00", "2024-01-01 23:00:09", "2024-31-01"])
+        naive_timestamps = remove_timestamps_timezone(timestamps)
+        self.assertEqual(["2024-01-01 23:00:09"] * 2, naive_timestamps[:2].tolist())
+        self.assertTrue(pd.isna(naive_timestamps[2]))
+
+    @patch.dict("commons.util.environ", {"SOURCE_TIMEZONES": "wind=Europe/Berlin, site_a=UTC"})
+    def test_get_source_timezones(self):
+        self.assertDictEqual({"solar": "unix", "wind": "Europe/Berlin", "site_a": "UTC"},
+                             get_source_timezones())
+
+    @patch.dict("commons.util.environ", {"MAX_WORKERS": "16"})
+    def test_get_max_workers(self):
+        self.assertEqual(16, get_max_workers())
+
+    def test_get_max_workers_invalid(self):
+        for value in ("eight", "0", "-2", ""):
+            with patch.dict("commons.util.environ", {"MAX_WORKERS": value}):
+                self.assertEqual(DEFAULT_MAX_WORKERS, get_max_workers())
+
+    @patch.dict("commons.util.environ", {}, clear=True)
+    def test_get_max_workers_default(self):
+        self.assertEqual(DEFAULT_MAX_WORKERS, get_max_workers())
+
+    def test_is_valid_timezone(self):
+        self.assertTrue(is_valid_timezone("Europe/Berlin"))
+        self.assertFalse(is_valid_timezone("Europe/Berlinn"))
+
     @patch("commons.util.request_api_call")
     def test_get_wind_data(self, mock_request_api_call):
         mock_request_api_call.return_value = self.expected_wind_data
@@ -115,6 +203,15 @@ class UtilTest(unittest.TestCase):
         solar_data = get_solar_data("2024-01-01")
         self.assertEqual(self.expected_solar_data, solar_data)
 
+    @patch("commons.util.request_api_call")
+    def test_get_source_data(self, mock_request_api_call):
+        mock_request_api_call.return_value = self.expected_wind_data
+        source = {"name": "site_a_wind", "url_template": "/{date}/sites/a/windgen.csv"}
+        wind_data = get_source_data(source, "2024-01-01")
+        self.assertEqual(self.expected_wind_data, wind_data)
+        mock_request_api_call.assert_called_once_with(
+            api_base_url="/2024-01-01/sites/a/windgen.csv")
+
     def test_get_latest_week_date_range(self):
         week_range = get_latest_week_date_range("2024-01-01")
         self.assertEqual(self.expected_week_range, week_range)